@@ -1,5 +1,7 @@
 from __future__ import annotations
+import asyncio
 import logging
+import sys
 from datetime import timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -8,7 +10,16 @@ from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import CONF_MODEL
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .const import DOMAIN, MANUFACTURER, CONF_EMAIL, CONF_PASSWORD, CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT
+from .const import (
+    DOMAIN,
+    MANUFACTURER,
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_REFRESH_RATE,
+    CONF_REFRESH_RATE_DEFAULT,
+    REFRESH_BACKOFF_THRESHOLD,
+    REFRESH_BACKOFF_CEILING,
+)
 from .api import MolekuleApi
 
 PLATFORMS: list[str] = ["fan", "sensor"]
@@ -27,6 +38,55 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await api.close()
         raise ConfigEntryNotReady from err
 
+    # DeviceInfo is immutable per device outside of firmware upgrades, so
+    # reuse instances across refreshes instead of rebuilding them each tick
+    device_info_cache: dict[tuple, DeviceInfo] = {}
+
+    # Adaptive polling state: back off the refresh cadence while nothing is
+    # changing and snap back to the configured interval when it does
+    base_interval = timedelta(seconds=entry.options.get(CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT))
+    adaptive_state = {"snapshot": None, "unchanged_cycles": 0}
+
+    def _adjust_update_interval(processed_data):
+        """Back off polling while device state is unchanged, reset on change."""
+        snapshot = tuple(
+            (
+                device["serialNumber"],
+                device["mode"],
+                device["fanspeed"],
+                device["online"],
+                tuple(sorted(
+                    (k, v)
+                    for k, v in processed_data[device["serialNumber"]].items()
+                    if k != "device_info"
+                )),
+            )
+            for device in processed_data["content"]
+        )
+
+        if snapshot == adaptive_state["snapshot"]:
+            adaptive_state["unchanged_cycles"] += 1
+            if adaptive_state["unchanged_cycles"] >= REFRESH_BACKOFF_THRESHOLD:
+                # Never drop below the configured interval: if the user asked
+                # for a cadence above the ceiling, backing off must not
+                # effectively poll faster than that
+                backed_off = max(
+                    base_interval,
+                    min(
+                        coordinator.update_interval * 2,
+                        timedelta(seconds=REFRESH_BACKOFF_CEILING),
+                    ),
+                )
+                if backed_off != coordinator.update_interval:
+                    _LOGGER.debug("No device changes, backing off refresh to %s", backed_off)
+                    coordinator.update_interval = backed_off
+        else:
+            adaptive_state["snapshot"] = snapshot
+            adaptive_state["unchanged_cycles"] = 0
+            if coordinator.update_interval != base_interval:
+                _LOGGER.debug("Device state changed, restoring refresh to %s", base_interval)
+                coordinator.update_interval = base_interval
+
     async def async_update_data():
         """Fetch data from API endpoint."""
         try:
@@ -35,29 +95,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 raise UpdateFailed("No data received from API")
                 
             processed_data = {"content": devices_data.get("content", [])}
-            
-            # Fetch sensor data for each device
+
+            # Fetch sensor data for all supported devices concurrently so the
+            # refresh takes ~1 round-trip instead of one per device
+            sensor_serials = [
+                device["serialNumber"]
+                for device in processed_data["content"]
+                if ((device.get("subProduct") or {}).get("name") or "Unknown Model")
+                not in ["Molekule Air", "Unknown Model"]
+            ]
+            sensor_results = dict(
+                zip(
+                    sensor_serials,
+                    await asyncio.gather(
+                        *(api.get_sensor_data(serial) for serial in sensor_serials),
+                        return_exceptions=True,
+                    ),
+                )
+            )
+
             for device in processed_data["content"]:
-                serial = device["serialNumber"]
-                mac_address = device.get("macAddress", "")
-                device_model = device.get("subProduct", {}).get("name", "Unknown Model")
-                
-                _LOGGER.debug(f"Processing device {serial} ({device_model})")
-                
-                # Ensure all required fields exist with defaults
-                device["fanspeed"] = device.get("fanspeed", "1")
-                device["pecoFilter"] = device.get("pecoFilter", "0")
-                device["mode"] = device.get("mode", "manual")
-                device["online"] = device.get("online", "false")
-                
-                # Only fetch sensor data for supported models
-                sensor_data = None
-                if device_model not in ["Molekule Air", "Unknown Model"]:
-                    try:
-                        sensor_data = await api.get_sensor_data(serial)
-                    except Exception as err:
-                        _LOGGER.warning(f"Failed to get sensor data for {serial}: {err}")
-                
+                # Interned so entity lookups against by_serial hit the
+                # pointer-compare fast path in the dict probe
+                serial = device["serialNumber"] = sys.intern(device["serialNumber"])
+                mac_address = device.get("macAddress") or ""
+                device_model = (device.get("subProduct") or {}).get("name") or "Unknown Model"
+
+                _LOGGER.debug("Processing device %s (%s)", serial, device_model)
+
+                # Normalize the fields the integration reads in one pass;
+                # missing and None values both fall back to defaults
+                device["fanspeed"] = device.get("fanspeed") or "1"
+                device["pecoFilter"] = device.get("pecoFilter") or "0"
+                device["mode"] = device.get("mode") or "manual"
+                device["online"] = device.get("online") or "false"
+                device["name"] = device.get("name") or f"Molekule {serial}"
+                device["aqi"] = device.get("aqi") or ""
+
+                # Pre-parse the fields the fan entity reads on every state
+                # access, so the conversions happen once per refresh
+                try:
+                    device["_fanspeed_int"] = int(device["fanspeed"])
+                except (TypeError, ValueError):
+                    device["_fanspeed_int"] = 1
+                device["_is_off"] = device["mode"] == "off"
+                try:
+                    device["_peco_int"] = int(device["pecoFilter"])
+                except (TypeError, ValueError):
+                    _LOGGER.error("Invalid pecoFilter value: %s", device["pecoFilter"])
+                    device["_peco_int"] = None
+                device["_aqi_norm"] = device["aqi"].lower()
+
+                # One failing device should not mark the whole integration
+                # unavailable; fall back to the empty sensor structure
+                sensor_data = sensor_results.get(serial)
+                if isinstance(sensor_data, BaseException):
+                    _LOGGER.warning("Failed to get sensor data for %s: %s", serial, sensor_data)
+                    sensor_data = None
+
                 if sensor_data:
                     processed_data[serial] = sensor_data
                 else:
@@ -70,28 +165,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         "CO2": None,
                     }
                 
-                # Create DeviceInfo
-                device_info = DeviceInfo(
-                    identifiers={(DOMAIN, serial)},
-                    name=device.get("name", f"Molekule {serial}"),
-                    manufacturer=MANUFACTURER,
-                    model=device_model,
-                    sw_version=device.get("firmwareVersion", "Unknown"),
-                )
-                
-                # Add mac address if available
-                if mac_address:
-                    device_info["identifiers"].add((DOMAIN, mac_address))
-                    device_info["connections"] = {("mac", mac_address)}
-                
+                # Create DeviceInfo, reusing the cached instance unless an
+                # identifying field changed
+                cache_key = (serial, device.get("firmwareVersion"), mac_address)
+                device_info = device_info_cache.get(cache_key)
+                if device_info is None:
+                    device_info = DeviceInfo(
+                        identifiers={(DOMAIN, serial)},
+                        name=device["name"],
+                        manufacturer=MANUFACTURER,
+                        model=device_model,
+                        sw_version=device.get("firmwareVersion") or "Unknown",
+                    )
+
+                    # Add mac address if available
+                    if mac_address:
+                        device_info["identifiers"].add((DOMAIN, mac_address))
+                        device_info["connections"] = {("mac", mac_address)}
+
+                    device_info_cache[cache_key] = device_info
+
                 processed_data[serial]["device_info"] = device_info
-            
+
+            # Index devices by serial so entity properties resolve their
+            # device with a hash lookup instead of scanning the list
+            processed_data["by_serial"] = {
+                device["serialNumber"]: device for device in processed_data["content"]
+            }
+
+            _adjust_update_interval(processed_data)
+
             return processed_data
 
         except asyncio.CancelledError:
             raise
         except Exception as err:
-            _LOGGER.error(f"Error communicating with API: {err}", exc_info=True)
+            _LOGGER.error("Error communicating with API: %s", err, exc_info=True)
             raise UpdateFailed(f"Error communicating with API: {err}")
 
     coordinator = DataUpdateCoordinator(
@@ -99,7 +208,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER,
         name="molekule_devices",
         update_method=async_update_data,
-        update_interval=timedelta(seconds=entry.options.get(CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT)),
+        update_interval=base_interval,
+        # The processed dict compares structurally, so skip listener
+        # dispatch (and the resulting state writes) when nothing changed
+        always_update=False,
     )
 
     # Fetch initial data so we have data when entities subscribe
@@ -1,25 +1,100 @@
 import aiohttp
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from warrant import Cognito
 from .const import API_CLIENT_ID, API_POOL_ID, API_URL, API_REGION
+import json
 import logging
+import random
 import time
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
+try:
+    # orjson ships with Home Assistant and parses the device payloads
+    # noticeably faster than the stdlib
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_serialize(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _json_loads = json.loads
+    _json_serialize = json.dumps
+
 _LOGGER = logging.getLogger(__name__)
 
+# Device-list cache tuning: payloads younger than the max age are served
+# directly; older ones are served stale while a background task revalidates.
+# The windows are short on purpose: they only coalesce bursts (config-flow
+# validation, startup), while the steady-state poll cadence always gets a
+# blocking fresh fetch of the dynamic device state.
+DEVICES_CACHE_MAX_AGE = 10  # seconds
+DEVICES_CACHE_SWR = 30  # seconds
+
+# Pollutant types surfaced as sensors, and the empty result template
+_SENSOR_DATA_TEMPLATE = {
+    "PM2_5": None,
+    "PM10": None,
+    "RH": None,
+    "TVOC": None,
+    "CO2": None,
+}
+_WANTED_POLLUTANTS = frozenset(_SENSOR_DATA_TEMPLATE)
+
+# Refresh the Cognito token in the background 5 minutes before the
+# one-hour expiry so requests almost never hit a 401
+TOKEN_REFRESH_INTERVAL = 3300  # seconds
+
+# Coalesce rapid-fire control commands (e.g. a UI slider drag) so only
+# the latest value per device is POSTed
+COMMAND_DEBOUNCE = 0.15  # seconds
+
+def _has_none(d) -> bool:
+    """Return True if the structure contains a None value anywhere."""
+    stack = deque((d,))
+    while stack:
+        container = stack.pop()
+        values = container.values() if type(container) is dict else container
+        for v in values:
+            if v is None:
+                return True
+            if type(v) is dict or type(v) is list:
+                stack.append(v)
+    return False
+
 def clean_none_values(d):
-    """Recursively remove all None values from dictionaries and lists, and convert to empty string"""
-    if isinstance(d, dict):
-        return {k: clean_none_values(v) for k, v in d.items() if v is not None}
-    elif isinstance(d, list):
-        return [clean_none_values(v) for v in d if v is not None]
-    elif d is None:
+    """Remove all None values from dictionaries and lists, and convert to empty string.
+
+    Walks the structure iteratively with an explicit stack and mutates
+    containers in place; payloads without any None values are returned
+    untouched after a cheap read-only scan.
+    """
+    if d is None:
         return ""
-    else:
+    if not (type(d) is dict or type(d) is list):
         return d
+    if not _has_none(d):
+        return d
+
+    stack = deque((d,))
+    while stack:
+        container = stack.pop()
+        if type(container) is dict:
+            dropped = [k for k, v in container.items() if v is None]
+            for k in dropped:
+                del container[k]
+            for v in container.values():
+                if type(v) is dict or type(v) is list:
+                    stack.append(v)
+        else:
+            if any(v is None for v in container):
+                container[:] = [v for v in container if v is not None]
+            for v in container:
+                if type(v) is dict or type(v) is list:
+                    stack.append(v)
+    return d
 
 class MolekuleApiError(Exception):
     """Base exception for Molekule API errors."""
@@ -36,28 +111,61 @@ class ApiConnectionError(MolekuleApiError):
 class MolekuleApi:
     """Molekule API client with improved error handling and session management."""
     
-    def __init__(self, email: str, password: str):
-        """Initialize the API client."""
+    def __init__(
+        self, email: str, password: str, session: Optional[aiohttp.ClientSession] = None
+    ):
+        """Initialize the API client.
+
+        An externally managed aiohttp session (e.g. Home Assistant's
+        shared client session) may be passed in; it is reused as-is and
+        never closed by this client.
+        """
         self.email = email
         self.password = password
         self.cognito: Optional[Cognito] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._external_session = session is not None
         self.token: Optional[str] = None
-        self.token_expiration: Optional[datetime] = None
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._token_deadline: Optional[float] = None
         self._session_lock = asyncio.Lock()
         self._auth_lock = asyncio.Lock()
         self._request_timeout = aiohttp.ClientTimeout(total=30)
+        self._connector_kwargs = {
+            "limit": 10,
+            "limit_per_host": 5,
+            "ttl_dns_cache": 300,
+            "enable_cleanup_closed": True,
+            "keepalive_timeout": 75,
+        }
         self._retry_attempts = 3
         self._retry_delay = 1  # seconds
+        self._devices_cache: Optional[tuple[Dict[str, Any], float]] = None
+        self._devices_revalidate_task: Optional[asyncio.Task] = None
+        self._cached_auth_headers: Optional[Dict[str, str]] = None
+        self._sensor_url_cache: Dict[str, str] = {}
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._pending_commands: Dict[str, tuple[Dict[str, Any], asyncio.TimerHandle]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session.
 
-    @property
-    async def session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session with locking."""
+        The live-session check is done without the lock so concurrent
+        requests are not serialized; the lock is only taken on the cold
+        path that actually creates a session.
+        """
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+        if self._external_session:
+            # An externally managed session is used even if closed; its
+            # lifecycle is not ours to handle
+            return self._session
         async with self._session_lock:
             if self._session is None or self._session.closed:
                 self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(**self._connector_kwargs),
                     timeout=self._request_timeout,
+                    json_serialize=_json_serialize,
                     headers={
                         "x-api-version": "1.0",
                         "Content-Type": "application/json",
@@ -68,17 +176,27 @@ class MolekuleApi:
     async def authenticate(self) -> None:
         """Authenticate with the Molekule API."""
         async with self._auth_lock:
-            try:
-                loop = asyncio.get_running_loop()
-                self.cognito = await loop.run_in_executor(
-                    self.executor, self._create_and_authenticate_cognito
-                )
-                self.token = self.cognito.id_token
-                self.token_expiration = datetime.now() + timedelta(hours=1)
-                _LOGGER.debug("Successfully authenticated with Molekule API")
-            except Exception as err:
-                _LOGGER.error("Authentication failed: %s", str(err))
-                raise AuthenticationError(f"Failed to authenticate: {err}") from err
+            await self._do_authenticate()
+
+    async def _do_authenticate(self) -> None:
+        """Authenticate with Cognito; the caller must hold _auth_lock."""
+        try:
+            loop = asyncio.get_running_loop()
+            self.cognito = await loop.run_in_executor(
+                None, self._create_and_authenticate_cognito
+            )
+            self.token = self.cognito.id_token
+            self._token_deadline = time.monotonic() + TOKEN_REFRESH_INTERVAL
+            self._cached_auth_headers = {
+                "Authorization": self.token,
+                "x-api-version": "1.0",
+                "Content-Type": "application/json",
+            }
+            self._schedule_token_refresh()
+            _LOGGER.debug("Successfully authenticated with Molekule API")
+        except Exception as err:
+            _LOGGER.error("Authentication failed: %s", str(err))
+            raise AuthenticationError(f"Failed to authenticate: {err}") from err
 
     def _create_and_authenticate_cognito(self) -> Cognito:
         """Create and authenticate Cognito client in executor."""
@@ -95,26 +213,44 @@ class MolekuleApi:
             _LOGGER.error("Cognito authentication failed: %s", str(err))
             raise
 
+    def _schedule_token_refresh(self) -> None:
+        """Schedule a background token refresh shortly before expiry."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self._refresh_handle = loop.call_later(
+            TOKEN_REFRESH_INTERVAL,
+            lambda: asyncio.create_task(self.refresh_token()),
+        )
+
     async def refresh_token(self) -> None:
         """Refresh the authentication token."""
         async with self._auth_lock:
             try:
                 loop = asyncio.get_running_loop()
                 await loop.run_in_executor(
-                    self.executor, self.cognito.renew_access_token
+                    None, self.cognito.renew_access_token
                 )
                 self.token = self.cognito.id_token
-                self.token_expiration = datetime.now() + timedelta(hours=1)
+                self._token_deadline = time.monotonic() + TOKEN_REFRESH_INTERVAL
+                self._cached_auth_headers = {
+                    "Authorization": self.token,
+                    "x-api-version": "1.0",
+                    "Content-Type": "application/json",
+                }
+                self._schedule_token_refresh()
                 _LOGGER.debug("Successfully refreshed Molekule API token")
             except Exception as err:
                 _LOGGER.warning("Token refresh failed, re-authenticating: %s", str(err))
-                await self.authenticate()
+                # The lock is already held here; re-entering authenticate()
+                # would deadlock on the non-reentrant asyncio lock
+                await self._do_authenticate()
 
     async def ensure_token_valid(self) -> None:
         """Ensure the authentication token is valid."""
-        if not self.token or not self.token_expiration:
+        if not self.token or self._token_deadline is None:
             await self.authenticate()
-        elif datetime.now() >= self.token_expiration - timedelta(minutes=5):
+        elif time.monotonic() >= self._token_deadline:
             await self.refresh_token()
 
     async def _make_request(
@@ -122,17 +258,17 @@ class MolekuleApi:
     ) -> Optional[Dict[str, Any]]:
         """Make an API request with retry logic."""
         await self.ensure_token_valid()
-        client_session = await self.session
-        headers = {"Authorization": self.token, **client_session.headers}
-        
+        client_session = await self._get_session()
+
         for attempt in range(self._retry_attempts):
             try:
                 async with client_session.request(
-                    method, url, headers=headers, **kwargs
+                    # The session carries the static headers; only the cached
+                    # auth header is merged in per request
+                    method, url, headers=self._cached_auth_headers, **kwargs
                 ) as response:
                     if response.status == 401:
                         await self.authenticate()
-                        headers["Authorization"] = self.token
                         continue
                     
                     if response.status == 204:
@@ -146,38 +282,85 @@ class MolekuleApi:
                         )
                         return None
                         
-                    return await response.json()
+                    return await response.json(loads=_json_loads)
                     
             except (aiohttp.ClientError, asyncio.TimeoutError) as err:
                 _LOGGER.error("Request failed (attempt %d/%d): %s",
                             attempt + 1, self._retry_attempts, str(err))
                 if attempt + 1 < self._retry_attempts:
-                    await asyncio.sleep(self._retry_delay * (attempt + 1))
-                    await self.close()  # Force session recreation
-                    client_session = await self.session
+                    # Jittered exponential backoff avoids synchronized retry
+                    # storms; the session and its warm connection pool stay
+                    # alive across retries
+                    backoff = min(30, self._retry_delay * (2 ** attempt))
+                    await asyncio.sleep(backoff * random.uniform(0.5, 1.5))
                 else:
                     raise ApiConnectionError(f"Failed after {self._retry_attempts} attempts: {err}")
         
         return None
 
     async def get_devices(self) -> Optional[Dict[str, Any]]:
-        """Get all devices associated with the account."""
+        """Get all devices associated with the account.
+
+        Responses are cached with a stale-while-revalidate policy: fresh
+        entries are returned directly, stale-but-recent entries are
+        returned immediately while a background task revalidates, and
+        only a cold or expired cache blocks on the network.
+        """
+        if self._devices_cache is not None:
+            data, fetched_at = self._devices_cache
+            age = time.monotonic() - fetched_at
+            if age < DEVICES_CACHE_MAX_AGE:
+                return data
+            if age < DEVICES_CACHE_MAX_AGE + DEVICES_CACHE_SWR:
+                if (
+                    self._devices_revalidate_task is None
+                    or self._devices_revalidate_task.done()
+                ):
+                    self._devices_revalidate_task = asyncio.create_task(
+                        self._revalidate_devices()
+                    )
+                return data
+        return await self._fetch_devices()
+
+    async def _fetch_devices(self) -> Optional[Dict[str, Any]]:
+        """Fetch the device list from the API and refresh the cache."""
         try:
+            # The coordinator normalizes the handful of fields it reads, so
+            # the payload is not walked by clean_none_values here
             data = await self._make_request("GET", API_URL)
-            return clean_none_values(data) if data else None
+            if not data:
+                return None
+            self._devices_cache = (data, time.monotonic())
+            return data
         except Exception as err:
             _LOGGER.error("Failed to get devices: %s", str(err))
             return None
 
+    async def _revalidate_devices(self) -> None:
+        """Refresh the device-list cache in the background."""
+        await self._fetch_devices()
+
+    def _invalidate_devices_cache(self) -> None:
+        """Drop the cached device list, e.g. after a control command."""
+        self._devices_cache = None
+
     async def get_sensor_data(self, serial: str) -> Optional[Dict[str, Any]]:
         """Get sensor data for a specific device."""
-        end_time = int(time.time() * 1000)
+        # Quantize the window to the 5s resolution boundary so repeated
+        # polls within the quantum produce identical URLs and stay
+        # cacheable upstream
+        now_ms = int(time.time() * 1000)
+        end_time = now_ms - (now_ms % 5000)
         start_time = end_time - 3600000  # 1 hour ago
-        
-        url = (f"{API_URL}{serial}/sensordata"
-               f"?aggregation=false&fromDate={start_time}"
-               f"&resolution=5&toDate={end_time}")
-        
+
+        # Only the time window varies per poll, so the rest of the URL is
+        # built once per serial
+        base = self._sensor_url_cache.setdefault(
+            serial,
+            f"{API_URL}{serial}/sensordata?aggregation=false&resolution=5",
+        )
+        url = f"{base}&fromDate={start_time}&toDate={end_time}"
+
         try:
             data = await self._make_request("GET", url)
             return self._process_sensor_data(data) if data else None
@@ -192,30 +375,75 @@ class MolekuleApi:
         if not data or 'sensorData' not in data:
             return None
 
-        processed_data = {
-            "PM2_5": None,
-            "PM10": None,
-            "RH": None,
-            "TVOC": None,
-            "CO2": None,
-        }
+        processed_data = _SENSOR_DATA_TEMPLATE.copy()
 
         try:
             for pollutant in data['sensorData']:
                 pollutant_type = pollutant['type']
-                if pollutant_type in processed_data:
-                    values = pollutant.get('sensorDataValue', [])
-                    valid_values = [v['v'] for v in values if v['v'] != -1]
-                    if valid_values:
-                        processed_data[pollutant_type] = valid_values[-1]
-            
+                if pollutant_type in _WANTED_POLLUTANTS:
+                    # Scan backwards for the most recent valid reading
+                    # instead of materializing a filtered list
+                    values = pollutant.get('sensorDataValue') or []
+                    for i in range(len(values) - 1, -1, -1):
+                        v = values[i]['v']
+                        if v != -1:
+                            processed_data[pollutant_type] = v
+                            break
+
             return processed_data
         except Exception as err:
             _LOGGER.error("Error processing sensor data: %s", str(err))
             return None
 
+    def _debounce_command(self, serial: str, kind: str, value: Any) -> None:
+        """Remember the latest desired value and schedule a single flush.
+
+        All pending commands for a device share one timer and one flush
+        task, so power and fan-speed changes issued together are sent in
+        order instead of racing as separate POSTs.
+        """
+        pending = self._pending_commands.get(serial)
+        if pending:
+            values, handle = pending
+            handle.cancel()
+        else:
+            values = {}
+        if kind in ("fan", "mode"):
+            # Fan speed and smart mode are mutually exclusive controls;
+            # only the most recent of the two should be sent
+            values.pop("mode" if kind == "fan" else "fan", None)
+        values[kind] = value
+        loop = asyncio.get_running_loop()
+        handle = loop.call_later(
+            COMMAND_DEBOUNCE,
+            lambda: asyncio.create_task(self._flush_commands(serial)),
+        )
+        self._pending_commands[serial] = (values, handle)
+
+    async def _flush_commands(self, serial: str) -> None:
+        """Send the most recent pending commands for a device.
+
+        Power is sent before mode or fan speed so neither reaches a
+        device that has not been switched on yet.
+        """
+        pending = self._pending_commands.pop(serial, None)
+        if pending is None:
+            return
+        values = pending[0]
+        if "power" in values:
+            await self._send_power_status(serial, values["power"])
+        if "mode" in values:
+            await self._send_auto_mode(serial, values["mode"])
+        if "fan" in values:
+            await self._send_fan_speed(serial, values["fan"])
+
     async def set_power_status(self, serial: str, status: bool) -> bool:
-        """Set device power status."""
+        """Set device power status, coalescing rapid repeat calls."""
+        self._debounce_command(serial, "power", status)
+        return True
+
+    async def _send_power_status(self, serial: str, status: bool) -> bool:
+        """POST the power status to the device."""
         url = f"{API_URL}{serial}/actions/set-power-status"
         try:
             await self._make_request(
@@ -223,13 +451,19 @@ class MolekuleApi:
                 url,
                 json={"status": "on" if status else "off"}
             )
+            self._invalidate_devices_cache()
             return True
         except Exception as err:
             _LOGGER.error("Failed to set power status: %s", str(err))
             return False
 
     async def set_fan_speed(self, serial: str, speed: int) -> bool:
-        """Set device fan speed."""
+        """Set device fan speed, coalescing rapid repeat calls."""
+        self._debounce_command(serial, "fan", speed)
+        return True
+
+    async def _send_fan_speed(self, serial: str, speed: int) -> bool:
+        """POST the fan speed to the device."""
         url = f"{API_URL}{serial}/actions/set-fan-speed"
         try:
             await self._make_request(
@@ -237,6 +471,7 @@ class MolekuleApi:
                 url,
                 json={"fanSpeed": speed}
             )
+            self._invalidate_devices_cache()
             return True
         except Exception as err:
             _LOGGER.error("Failed to set fan speed: %s", str(err))
@@ -245,21 +480,26 @@ class MolekuleApi:
     async def set_auto_mode(
         self, serial: str, auto: bool, silent: bool = False
     ) -> bool:
-        """Set device auto mode."""
+        """Set device auto mode, coalescing rapid repeat calls."""
         if auto:
-            url = f"{API_URL}{serial}/actions/enable-smart-mode"
-            try:
-                await self._make_request(
-                    "POST",
-                    url,
-                    json={"silent": str(int(silent))}
-                )
-                return True
-            except Exception as err:
-                _LOGGER.error("Failed to set auto mode: %s", str(err))
-                return False
-        else:
-            return await self.set_fan_speed(serial, 1)
+            self._debounce_command(serial, "mode", silent)
+            return True
+        return await self.set_fan_speed(serial, 1)
+
+    async def _send_auto_mode(self, serial: str, silent: bool) -> bool:
+        """POST smart mode to the device."""
+        url = f"{API_URL}{serial}/actions/enable-smart-mode"
+        try:
+            await self._make_request(
+                "POST",
+                url,
+                json={"silent": str(int(silent))}
+            )
+            self._invalidate_devices_cache()
+            return True
+        except Exception as err:
+            _LOGGER.error("Failed to set auto mode: %s", str(err))
+            return False
 
     async def get_aqi(self, serial: str) -> Optional[Dict[str, Any]]:
         """Get air quality index for a device."""
@@ -273,10 +513,22 @@ class MolekuleApi:
 
     async def close(self) -> None:
         """Close all connections."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
+        for _, handle in self._pending_commands.values():
+            handle.cancel()
+        self._pending_commands.clear()
+
+        if self._devices_revalidate_task and not self._devices_revalidate_task.done():
+            self._devices_revalidate_task.cancel()
+
         async with self._session_lock:
-            if self._session and not self._session.closed:
+            if (
+                not self._external_session
+                and self._session
+                and not self._session.closed
+            ):
                 await self._session.close()
                 self._session = None
-        
-        if self.executor:
-            self.executor.shutdown(wait=False)
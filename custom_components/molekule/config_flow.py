@@ -1,15 +1,33 @@
 from typing import Any, Dict, Optional
+import asyncio
 import voluptuous as vol
 import logging
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowResult
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import DOMAIN, CONF_EMAIL, CONF_PASSWORD, CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT, CONF_SILENT_AUTO
 from .api import MolekuleApi
 
 _LOGGER = logging.getLogger(__name__)
 
+# Schemas are static, so build the validators once at import instead of
+# on every form render
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EMAIL): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("sync_interval", default=CONF_REFRESH_RATE_DEFAULT): int,
+        vol.Optional(CONF_SILENT_AUTO, default=False): bool,
+    }
+)
+
 class ConfigFlowError(HomeAssistantError):
     """Base class for config flow errors."""
 
@@ -29,53 +47,50 @@ class MolekuleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
         
         if user_input is None:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_EMAIL): str,
-                        vol.Required(CONF_PASSWORD): str,
-                    }
-                ),
-            )
+            return self.async_show_form(step_id="user", data_schema=USER_SCHEMA)
 
         try:
             _LOGGER.debug("Attempting to authenticate with Molekule API")
-            api = MolekuleApi(user_input[CONF_EMAIL], user_input[CONF_PASSWORD])
+            # Reuse Home Assistant's shared client session so validation
+            # does not pay for a fresh TLS handshake and connector teardown
+            api = MolekuleApi(
+                user_input[CONF_EMAIL],
+                user_input[CONF_PASSWORD],
+                session=async_get_clientsession(self.hass),
+            )
             
             try:
-                await api.authenticate()
+                # Bound the Cognito handshake so a hung connection cannot
+                # pin the config flow indefinitely
+                async with asyncio.timeout(10):
+                    await api.authenticate()
                 _LOGGER.debug("Successfully authenticated with Molekule API")
+            except asyncio.TimeoutError:
+                raise
             except Exception as auth_err:
                 _LOGGER.error("Authentication failed with exception: %s", str(auth_err), exc_info=True)
                 raise AuthError("Failed to authenticate") from auth_err
             
             try:
                 # Test API connection by attempting to get devices
-                devices = await api.get_devices()
+                async with asyncio.timeout(15):
+                    devices = await api.get_devices()
                 if devices is None:
                     _LOGGER.error("Failed to get devices after successful authentication")
                     raise ApiError("Failed to get devices")
                 _LOGGER.debug("Successfully retrieved devices: %s", devices)
+            except asyncio.TimeoutError:
+                raise
             except Exception as dev_err:
                 _LOGGER.error("Failed to get devices: %s", str(dev_err), exc_info=True)
                 raise ApiError("Failed to get device list") from dev_err
             finally:
                 await api.close()
 
-            # Check if this email is already configured
+            # If this email is already configured, update the existing
+            # entry and abort instead of creating a duplicate
             await self.async_set_unique_id(user_input[CONF_EMAIL])
-            
-            # Instead of aborting, update existing entry if one exists
-            existing_entry = await self.async_set_unique_id(user_input[CONF_EMAIL])
-            if existing_entry:
-                _LOGGER.debug("Updating existing configuration entry")
-                self.hass.config_entries.async_update_entry(
-                    existing_entry,
-                    data=user_input,
-                )
-                # Let the user know we're updating instead of creating new
-                return self.async_abort(reason="reauth_successful")
+            self._abort_if_unique_id_configured(updates=user_input)
 
             # Create new entry if one doesn't exist
             return self.async_create_entry(
@@ -83,6 +98,12 @@ class MolekuleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data=user_input,
             )
 
+        except AbortFlow:
+            # Unique-id aborts (e.g. already_configured) must propagate so
+            # the flow ends instead of showing an error form
+            raise
+        except asyncio.TimeoutError:
+            errors["base"] = "cannot_connect"
         except AuthError:
             errors["base"] = "invalid_auth"
         except ApiError:
@@ -94,12 +115,7 @@ class MolekuleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # If we get here, there was an error
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_EMAIL): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=USER_SCHEMA,
             errors=errors,
         )
 
@@ -123,16 +139,13 @@ class MolekuleOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA,
                 {
-                    vol.Optional(
-                        "sync_interval",
-                        default=self.config_entry.options.get(CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT),
-                    ): int,
-                    vol.Optional(
-                        CONF_SILENT_AUTO,
-                        default=self.config_entry.options.get(CONF_SILENT_AUTO, False),
-                    ): bool,
-                }
+                    "sync_interval": self.config_entry.options.get(
+                        CONF_REFRESH_RATE, CONF_REFRESH_RATE_DEFAULT
+                    ),
+                    CONF_SILENT_AUTO: self.config_entry.options.get(CONF_SILENT_AUTO, False),
+                },
             ),
         )
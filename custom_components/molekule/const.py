@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 from homeassistant.const import (
     CONF_EMAIL,
     CONF_PASSWORD,
@@ -17,6 +19,38 @@ CAPABILITY_AUTO = "AutoFunctionality"
 CAPABILITY_AQI = "AirQualityMonitor"
 CAPABILITY_MAX_FAN_SPEED = "MaxFanSpeed"
 
+class ModelCapabilities(NamedTuple):
+    """Per-model device capabilities shared by the fan and sensor platforms."""
+
+    max_fan_speed: int
+    auto: bool
+    has_sensor_data: bool
+    supported_sensors: frozenset
+
+MODEL_CAPABILITIES = {
+    "Molekule Air": ModelCapabilities(
+        max_fan_speed=3,
+        auto=False,
+        has_sensor_data=False,  # No sensordata endpoint support
+        supported_sensors=frozenset({"peco_filter"}),
+    ),
+    "Molekule Air Pro": ModelCapabilities(
+        max_fan_speed=6,
+        auto=True,
+        has_sensor_data=True,  # Has sensordata endpoint support
+        supported_sensors=frozenset(
+            {"air_quality", "humidity", "pm25", "pm10", "voc", "co2", "peco_filter"}
+        ),
+    ),
+}
+
+DEFAULT_CAPABILITIES = ModelCapabilities(
+    max_fan_speed=3,
+    auto=False,
+    has_sensor_data=False,
+    supported_sensors=frozenset({"air_quality", "peco_filter"}),
+)
+
 # Entity keys
 KEY_AIR_QUALITY = "air_quality"
 KEY_HUMIDITY = "humidity"
@@ -28,6 +62,6 @@ CONF_REFRESH_RATE = "conf_refresh_rate"
 CONF_REFRESH_RATE_DEFAULT = 300
 CONF_SILENT_AUTO = "conf_silent_auto"
 
-# Capability
-CAPABILITY_AUTO = "AutoFunctionality"
-CAPABILITY_MAX_FAN_SPEED = "MaxFanSpeed"
+# Adaptive polling: back off after this many unchanged refreshes, up to the ceiling
+REFRESH_BACKOFF_THRESHOLD = 3
+REFRESH_BACKOFF_CEILING = 1800
@@ -1,41 +1,26 @@
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.fan import FanEntity, FanEntityFeature
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.percentage import (
     int_states_in_range,
     ranged_value_to_percentage,
     percentage_to_ranged_value,
 )
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
-from .const import DOMAIN, CONF_SILENT_AUTO, CAPABILITY_AUTO, CAPABILITY_MAX_FAN_SPEED
+from .const import DOMAIN, CONF_SILENT_AUTO, MODEL_CAPABILITIES, DEFAULT_CAPABILITIES
 import logging
-import asyncio
+import sys
 
 _LOGGER = logging.getLogger(__name__)
 
-# Device-specific capabilities
-MODEL_CAPABILITIES = {
-    "Molekule Air": {
-        CAPABILITY_MAX_FAN_SPEED: 3,
-        CAPABILITY_AUTO: False,
-    },
-    "Molekule Air Pro": {
-        CAPABILITY_MAX_FAN_SPEED: 6,
-        CAPABILITY_AUTO: True,
-    }
-}
-
-DEFAULT_CAPABILITIES = {
-    CAPABILITY_MAX_FAN_SPEED: 3,
-    CAPABILITY_AUTO: False,
-}
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     api = hass.data[DOMAIN][entry.entry_id]["api"]
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     
+    # The coordinator is refreshed once in async_setup_entry before the
+    # platforms are forwarded, so data is already populated here
     fans = []
-    await coordinator.async_config_entry_first_refresh()
 
     if not coordinator.data or "content" not in coordinator.data:
         _LOGGER.error("No data received from the Molekule API")
@@ -44,65 +29,102 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     for device in coordinator.data["content"]:
         fans.append(MolekuleFan(coordinator, device["serialNumber"], api))
     
-    async_add_entities(fans, True)
+    async_add_entities(fans)
 
 class MolekuleFan(CoordinatorEntity, FanEntity):
     def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
         super().__init__(coordinator)
-        self._device_id = device_id
+        self._device_id = sys.intern(device_id)
         self._api = api
         self._attr_unique_id = f"{device_id}_fan"
+        # Optimistic on/off state shown between a command and the
+        # coordinator refresh that confirms it
+        self._optimistic_on = None
+        self._cancel_confirm = None
+        # Resolved once per coordinator update rather than per property read
+        self._device_cache = coordinator.data["by_serial"].get(device_id)
         
-        # Get model capabilities
-        model = self._get_model()
-        capabilities = MODEL_CAPABILITIES.get(model, DEFAULT_CAPABILITIES)
-        
+        # The model never changes for a given device, so resolve the
+        # capabilities once instead of on every property access
+        self._model = self._get_model()
+        self._capabilities = MODEL_CAPABILITIES.get(self._model, DEFAULT_CAPABILITIES)
+        self._supports_auto = self._capabilities.auto
+        self._speed_range_cached = (1, self._capabilities.max_fan_speed)
+
         # Set up supported features based on model capabilities
         self._attr_supported_features = FanEntityFeature.SET_SPEED | FanEntityFeature.TURN_ON | FanEntityFeature.TURN_OFF
-        if capabilities[CAPABILITY_AUTO]:
+        if self._supports_auto:
             self._attr_supported_features |= FanEntityFeature.PRESET_MODE
             self._attr_preset_modes = ["auto", "manual"]
         
         self._attr_device_info = coordinator.data[device_id]["device_info"]
 
     def _get_model(self):
-        if not self._device:
+        if not self._device_cache:
             return "Unknown"
-        return self._device.get('subProduct', {}).get('name', 'Unknown')
-
-    @property
-    def _device(self):
-        return next((device for device in self.coordinator.data["content"] if device["serialNumber"] == self._device_id), None)
+        return self._device_cache.get('subProduct', {}).get('name', 'Unknown')
 
     @property
     def _speed_range(self):
-        if not self._device:
-            return (1, DEFAULT_CAPABILITIES[CAPABILITY_MAX_FAN_SPEED])
-        model = self._get_model()
-        capabilities = MODEL_CAPABILITIES.get(model, DEFAULT_CAPABILITIES)
-        return (1, capabilities[CAPABILITY_MAX_FAN_SPEED])
+        return self._speed_range_cached
 
     @property
     def name(self):
-        return f"{self._device['name']} Fan" if self._device else None
+        return f"{self._device_cache['name']} Fan" if self._device_cache else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._device_cache = self.coordinator.data["by_serial"].get(self._device_id)
+        # Coordinator data supersedes any optimistic state
+        self._optimistic_on = None
+        super()._handle_coordinator_update()
+
+    def _schedule_confirm(self) -> None:
+        """(Re)schedule the single refresh that confirms a command.
+
+        Consecutive commands within the window collapse into one
+        coordinator refresh instead of stacking one per call.
+        """
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+        self._cancel_confirm = async_call_later(self.hass, 5, self._delayed_refresh)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending confirm refresh when the entity is removed."""
+        if self._cancel_confirm is not None:
+            self._cancel_confirm()
+            self._cancel_confirm = None
+        await super().async_will_remove_from_hass()
+
+    async def _delayed_refresh(self, _now) -> None:
+        """Confirm an optimistic command with a coordinator refresh."""
+        self._cancel_confirm = None
+        await self.coordinator.async_request_refresh()
+        # With always_update=False an unchanged refresh (e.g. the debounced
+        # command failed) skips the listener dispatch, so reconcile the
+        # optimistic state with the coordinator data here
+        if self._optimistic_on is not None:
+            self._optimistic_on = None
+            self.async_write_ha_state()
 
     @property
     def is_on(self):
-        return self._device['mode'] != "off" if self._device else None
+        if self._optimistic_on is not None:
+            return self._optimistic_on
+        return not self._device_cache['_is_off'] if self._device_cache else None
 
     @property
     def percentage(self):
-        if not self._device or self._device['mode'] == "off":
+        device = self._device_cache
+        if not device or device['_is_off']:
             return 0
-        return ranged_value_to_percentage(self._speed_range, int(self._device['fanspeed']))
+        return ranged_value_to_percentage(self._speed_range, device['_fanspeed_int'])
 
     @property
     def preset_mode(self):
-        model = self._get_model()
-        capabilities = MODEL_CAPABILITIES.get(model, DEFAULT_CAPABILITIES)
-        if not capabilities[CAPABILITY_AUTO]:
+        if not self._supports_auto:
             return None
-        return "auto" if self._device and self._device['mode'] == "smart" else "manual"
+        return "auto" if self._device_cache and self._device_cache['mode'] == "smart" else "manual"
 
     @property
     def speed_count(self):
@@ -114,38 +136,37 @@ class MolekuleFan(CoordinatorEntity, FanEntity):
         else:
             speed = round(percentage_to_ranged_value(self._speed_range, percentage))
             await self._api.set_fan_speed(self._device_id, speed)
-            await self.coordinator.async_request_refresh()
+            self._schedule_confirm()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
-        model = self._get_model()
-        capabilities = MODEL_CAPABILITIES.get(model, DEFAULT_CAPABILITIES)
-        if not capabilities[CAPABILITY_AUTO]:
-            _LOGGER.warning(f"Auto mode not supported on {model}")
+        if not self._supports_auto:
+            _LOGGER.warning("Auto mode not supported on %s", self._model)
             return
             
         silent_auto = self.coordinator.config_entry.options.get(CONF_SILENT_AUTO, False)
         await self._api.set_auto_mode(self._device_id, preset_mode == "auto", silent_auto)
-        await self.coordinator.async_request_refresh()
+        self._schedule_confirm()
 
     async def async_turn_on(self, percentage: int | None = None, preset_mode: str | None = None, **kwargs) -> None:
         if not self.is_on:
             await self._api.set_power_status(self._device_id, True)
-        
-        model = self._get_model()
-        capabilities = MODEL_CAPABILITIES.get(model, DEFAULT_CAPABILITIES)
-        
+
         if percentage is not None:
             await self.async_set_percentage(percentage)
-        elif preset_mode is not None and capabilities[CAPABILITY_AUTO]:
+        elif preset_mode is not None and self._supports_auto:
             await self.async_set_preset_mode(preset_mode)
         else:
             # If no percentage or preset_mode is provided, set to the lowest speed
             await self.async_set_percentage(ranged_value_to_percentage(self._speed_range, self._speed_range[0]))
-        
-        await asyncio.sleep(5)
-        await self.coordinator.async_request_refresh()
+
+        # Show the new state immediately and let the coordinator confirm
+        # shortly after, instead of blocking the service call for 5s
+        self._optimistic_on = True
+        self.async_write_ha_state()
+        self._schedule_confirm()
 
     async def async_turn_off(self, **kwargs) -> None:
         await self._api.set_power_status(self._device_id, False)
-        await asyncio.sleep(5)
-        await self.coordinator.async_request_refresh()
+        self._optimistic_on = False
+        self.async_write_ha_state()
+        self._schedule_confirm()
@@ -1,6 +1,13 @@
-from homeassistant.core import HomeAssistant
+from bisect import bisect_left
+from dataclasses import dataclass
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.const import (
     UnitOfTime,
     PERCENTAGE,
@@ -10,50 +17,82 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from homeassistant.helpers.entity import EntityCategory
-from .const import DOMAIN
+from .const import DOMAIN, MODEL_CAPABILITIES, DEFAULT_CAPABILITIES
 import logging
-from enum import Enum
+import sys
 
 _LOGGER = logging.getLogger(__name__)
 
-# Define sensor support by model
-MODEL_CAPABILITIES = {
-    "Molekule Air": {
-        "has_sensor_data": False,  # No sensordata endpoint support
-        "supported_sensors": ["peco_filter"]
-    },
-    "Molekule Air Pro": {
-        "has_sensor_data": True,   # Has sensordata endpoint support
-        "supported_sensors": ["air_quality", "humidity", "pm25", "pm10", "voc", "co2", "peco_filter"]
-    }
-}
-
-DEFAULT_CAPABILITIES = {
-    "has_sensor_data": False,
-    "supported_sensors": ["air_quality", "peco_filter"]
-}
-
-class AirQualityLevel(Enum):
-    UNKNOWN = "unknown"
-    GOOD = "good"
-    MODERATE = "moderate"
-    BAD = "bad"
-    VERY_BAD = "very_bad"
-
+# API AQI strings mapped straight to the reported state values, so the
+# hot native_value path is a single dict lookup
 AQI_MAPPING = {
-    "good": AirQualityLevel.GOOD,
-    "moderate": AirQualityLevel.MODERATE,
-    "bad": AirQualityLevel.BAD,
-    "very bad": AirQualityLevel.VERY_BAD,
+    "good": "good",
+    "moderate": "moderate",
+    "bad": "bad",
+    "very bad": "very_bad",
 }
+AQI_UNKNOWN = "unknown"
+
+# Shared fallback so reads during transient states allocate nothing
+_EMPTY_READINGS: dict = {}
+
+@dataclass(frozen=True)
+class MolekuleSensorDescription(SensorEntityDescription):
+    """Describes a Molekule sensordata-backed sensor.
+
+    ``key`` is the pollutant key in the coordinator's sensor data;
+    ``sensor_type`` keeps the historical unique_id/name suffix and
+    ``capability`` the entry in the model capability table.
+    """
+
+    capability: str = ""
+    sensor_type: str = ""
+
+SENSOR_DATA_DESCRIPTIONS = (
+    MolekuleSensorDescription(
+        key="RH",
+        capability="humidity",
+        sensor_type="Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        native_unit_of_measurement=PERCENTAGE,
+    ),
+    MolekuleSensorDescription(
+        key="PM2_5",
+        capability="pm25",
+        sensor_type="PM2.5",
+        device_class=SensorDeviceClass.PM25,
+        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    ),
+    MolekuleSensorDescription(
+        key="PM10",
+        capability="pm10",
+        sensor_type="PM10",
+        device_class=SensorDeviceClass.PM10,
+        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    ),
+    MolekuleSensorDescription(
+        key="TVOC",
+        capability="voc",
+        sensor_type="VOC",
+        device_class=SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+        native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
+    ),
+    MolekuleSensorDescription(
+        key="CO2",
+        capability="co2",
+        sensor_type="CO2",
+        device_class=SensorDeviceClass.CO2,
+        native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
+    ),
+)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    api = hass.data[DOMAIN][entry.entry_id]["api"]
     
+    # The coordinator is refreshed once in async_setup_entry before the
+    # platforms are forwarded, so data is already populated here
     sensors = []
-    await coordinator.async_config_entry_first_refresh()
-    
+
     if not coordinator.data or "content" not in coordinator.data:
         _LOGGER.error("No data received from the Molekule API")
         return
@@ -66,161 +105,142 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         serial = device["serialNumber"]
         
         # Only add sensors that are supported by this model
-        if "air_quality" in capabilities["supported_sensors"]:
-            device_sensors.append(MolekuleAirQualitySensor(coordinator, serial, api))
+        if "air_quality" in capabilities.supported_sensors:
+            device_sensors.append(MolekuleAirQualitySensor(coordinator, serial))
         
-        if "peco_filter" in capabilities["supported_sensors"]:
-            device_sensors.append(MolekulePECOFilterSensor(coordinator, serial, api))
+        if "peco_filter" in capabilities.supported_sensors:
+            device_sensors.append(MolekulePECOFilterSensor(coordinator, serial))
             
         # Only add sensor data endpoint sensors if the model supports them
-        if capabilities["has_sensor_data"]:
-            if "humidity" in capabilities["supported_sensors"]:
-                device_sensors.append(MolekuleHumiditySensor(coordinator, serial, api))
-            if "pm25" in capabilities["supported_sensors"]:
-                device_sensors.append(MolekulePM25Sensor(coordinator, serial, api))
-            if "pm10" in capabilities["supported_sensors"]:
-                device_sensors.append(MolekulePM10Sensor(coordinator, serial, api))
-            if "voc" in capabilities["supported_sensors"]:
-                device_sensors.append(MolekuleVOCSensor(coordinator, serial, api))
-            if "co2" in capabilities["supported_sensors"]:
-                device_sensors.append(MolekuleCO2Sensor(coordinator, serial, api))
+        if capabilities.has_sensor_data:
+            device_sensors.extend(
+                MolekuleSensorDataSensor(coordinator, serial, description)
+                for description in SENSOR_DATA_DESCRIPTIONS
+                if description.capability in capabilities.supported_sensors
+            )
         
         sensors.extend(device_sensors)
-        _LOGGER.info(f"Created {len(device_sensors)} sensors for {model} device {device['name']}")
+        _LOGGER.info("Created %d sensors for %s device %s", len(device_sensors), model, device['name'])
     
     if not sensors:
         _LOGGER.warning("No compatible Molekule devices found. No sensors created.")
     
-    async_add_entities(sensors, True)
+    async_add_entities(sensors)
 
 class MolekuleSensorBase(CoordinatorEntity, SensorEntity):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api, sensor_type: str):
+    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, sensor_type: str):
         super().__init__(coordinator)
-        self._device_id = device_id
-        self._api = api
+        self._device_id = sys.intern(device_id)
         self._sensor_type = sensor_type
+        # The suffix is static per sensor; only the device name can change
+        self._name_suffix = sensor_type.replace('_', ' ').title()
         self._attr_unique_id = f"{device_id}_{sensor_type}"
+        self._attr_should_poll = False
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_device_info = coordinator.data[device_id]["device_info"]
-
-    @property
-    def _device(self):
-        return next((device for device in self.coordinator.data["content"] if device["serialNumber"] == self._device_id), None)
-
-    @property
-    def name(self):
-        return f"{self._device['name']} {self._sensor_type.replace('_', ' ').title()}" if self._device else None
-
-    async def async_update(self):
-        """Fetch new state data for the sensor."""
-        await self.coordinator.async_request_refresh()
+        # Resolved once per coordinator update rather than per property read
+        self._device_cache = coordinator.data["by_serial"].get(device_id)
+        self._readings = coordinator.data.get(device_id) or _EMPTY_READINGS
+        self._update_name()
+
+    def _update_name(self) -> None:
+        """Compose the entity name once per update instead of per read."""
+        device = self._device_cache
+        self._attr_name = f"{device['name']} {self._name_suffix}" if device else None
+
+    def _update_derived_state(self) -> None:
+        """Refresh values derived from the device dict.
+
+        Called after the cached device/readings are refreshed and before
+        the state write, so subclasses can precompute per-update values
+        instead of recomputing them on every property read.
+        """
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
+        self._device_cache = data["by_serial"].get(self._device_id)
+        self._readings = data.get(self._device_id) or _EMPTY_READINGS
+        self._update_name()
+        self._update_derived_state()
+        super()._handle_coordinator_update()
 
     @property
     def available(self):
         """Return if entity is available."""
-        return self._device is not None
+        return self.coordinator.last_update_success and self._device_cache is not None
 
 
-class MolekuleAirQualitySensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "air_quality")
-        self._attr_device_class = None  
-        self._attr_state_class = None  
-
-    @property
-    def native_value(self):
-        aqi = self._device.get('aqi', '').lower() if self._device else None
-        return AQI_MAPPING.get(aqi, AirQualityLevel.UNKNOWN).value
+AIR_QUALITY_DESCRIPTION = SensorEntityDescription(
+    key="air_quality",
+    icon="mdi:air-filter",
+)
 
-    @property
-    def icon(self):
-        return "mdi:air-filter"
+# PECO filter life icons by remaining-percentage band: <=10 critical,
+# <=30 warning, otherwise ok; bisect picks the band without branching
+_PECO_ICON_UNKNOWN = "mdi:help-circle-outline"
+_PECO_THRESHOLDS = (10, 30)
+_PECO_ICONS = (
+    "mdi:alert-circle-outline",
+    "mdi:alert-outline",
+    "mdi:check-circle-outline",
+)
 
-    @property
-    def extra_state_attributes(self):
-        if not self._device:
-            return {}
-        return {
-            "fan_speed": self._device.get("fanspeed"),
-            "mode": self._device.get("mode"),
-            "online": self._device.get("online"),
-            "silent": self._device.get("silent"),
-            "burst": self._device.get("burst"),
+class MolekuleAirQualitySensor(MolekuleSensorBase):
+    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator, device_id, "air_quality")
+        # The static icon lives on the description so HA reads it as an
+        # attribute instead of through a property call
+        self.entity_description = AIR_QUALITY_DESCRIPTION
+        self._attr_device_class = None
+        self._attr_state_class = None
+        self._update_derived_state()
+
+    def _update_derived_state(self) -> None:
+        """Rebuild the state and attributes dict once per update, not per read."""
+        device = self._device_cache
+        if not device:
+            self._attr_native_value = AQI_UNKNOWN
+            self._attr_extra_state_attributes = {}
+            return
+        self._attr_native_value = AQI_MAPPING.get(device['_aqi_norm'], AQI_UNKNOWN)
+        self._attr_extra_state_attributes = {
+            "fan_speed": device.get("fanspeed"),
+            "mode": device.get("mode"),
+            "online": device.get("online"),
+            "silent": device.get("silent"),
+            "burst": device.get("burst"),
         }
 
 class MolekulePECOFilterSensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "peco_filter")
+    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str):
+        super().__init__(coordinator, device_id, "peco_filter")
         self._attr_device_class = None
         self._attr_native_unit_of_measurement = PERCENTAGE
-
-    @property
-    def native_value(self):
-        if not self._device or 'pecoFilter' not in self._device:
-            return None
-        try:
-            return int(self._device['pecoFilter'])
-        except ValueError:
-            _LOGGER.error(f"Invalid pecoFilter value: {self._device['pecoFilter']}")
-            return None
-
-    @property
-    def icon(self):
-        if self.native_value is None:
-            return "mdi:help-circle-outline"
-        if self.native_value <= 10:
-            return "mdi:alert-circle-outline"
-        elif self.native_value <= 30:
-            return "mdi:alert-outline"
-        else:
-            return "mdi:check-circle-outline"
-
-class MolekuleHumiditySensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "Humidity")
-        self._attr_device_class = SensorDeviceClass.HUMIDITY
-        self._attr_native_unit_of_measurement = PERCENTAGE
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.get(self._device_id, {}).get('RH')
-
-class MolekulePM25Sensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "PM2.5")
-        self._attr_device_class = SensorDeviceClass.PM25
-        self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.get(self._device_id, {}).get('PM2_5')
-
-class MolekulePM10Sensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "PM10")
-        self._attr_device_class = SensorDeviceClass.PM10
-        self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.get(self._device_id, {}).get('PM10')
-
-class MolekuleVOCSensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "VOC")
-        self._attr_device_class = SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS
-        self._attr_native_unit_of_measurement = CONCENTRATION_MICROGRAMS_PER_CUBIC_METER
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.get(self._device_id, {}).get('TVOC')
-
-class MolekuleCO2Sensor(MolekuleSensorBase):
-    def __init__(self, coordinator: DataUpdateCoordinator, device_id: str, api):
-        super().__init__(coordinator, device_id, api, "CO2")
-        self._attr_device_class = SensorDeviceClass.CO2
-        self._attr_native_unit_of_measurement = CONCENTRATION_PARTS_PER_MILLION
-
-    @property
-    def native_value(self):
-        return self.coordinator.data.get(self._device_id, {}).get('CO2')
+        self._update_derived_state()
+
+    def _update_derived_state(self) -> None:
+        # Parsed once per refresh in the coordinator
+        value = self._device_cache['_peco_int'] if self._device_cache else None
+        self._attr_native_value = value
+        self._attr_icon = (
+            _PECO_ICON_UNKNOWN
+            if value is None
+            else _PECO_ICONS[bisect_left(_PECO_THRESHOLDS, value)]
+        )
+
+class MolekuleSensorDataSensor(MolekuleSensorBase):
+    """A sensor backed by one pollutant key of the sensordata endpoint."""
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device_id: str,
+        description: MolekuleSensorDescription,
+    ):
+        super().__init__(coordinator, device_id, description.sensor_type)
+        self.entity_description = description
+        self._update_derived_state()
+
+    def _update_derived_state(self) -> None:
+        self._attr_native_value = self._readings.get(self.entity_description.key)